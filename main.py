@@ -1,25 +1,38 @@
-import random
-import csv
+import os
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.feather as pa_feather
+
+try:
+    from numba import njit
+except ImportError:  # numba es opcional; sin él usamos el camino searchsorted
+    njit = None
+
+try:
+    import dask.dataframe as dd
+except ImportError:  # dask es opcional; sin él las reglas corren en serie
+    dd = None
 
 
 # -----------------------------
 # 1. Generar datos sintéticos
 # -----------------------------
 
-def generate_synthetic_transactions(n_rows: int = 1000):
-    random.seed(42)
+def generate_synthetic_transactions(n_rows: int = 1000) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
 
     base_time = datetime.now() - timedelta(days=7)  # transacciones de la última semana
 
-    customer_ids = list(range(1000, 1051))  # 51 clientes
-    home_countries_map = {cid: random.choice(["PY", "AR", "BR"]) for cid in customer_ids}
+    customer_ids = np.arange(1000, 1051, dtype=np.int32)  # 51 clientes
+    home_countries = rng.choice(["PY", "AR", "BR"], size=customer_ids.size)
 
-    countries = ["PY", "AR", "BR", "US", "MX", "NG", "RU", "CN", "ES", "DE"]
-    channels = ["APP", "WEB", "CAJERO", "POS", "SUCURSAL"]
-    merchant_categories = [
+    countries = np.array(["PY", "AR", "BR", "US", "MX", "NG", "RU", "CN", "ES", "DE"])
+    channels = np.array(["APP", "WEB", "CAJERO", "POS", "SUCURSAL"])
+    merchant_categories = np.array([
         "SUPERMERCADO",
         "ELECTRONICA",
         "RESTAURANTE",
@@ -28,161 +41,320 @@ def generate_synthetic_transactions(n_rows: int = 1000):
         "CASINO_ONLINE",
         "LUJOS",
         "TRANSFERENCIA_P2P",
-    ]
+    ])
+
+    # montos base por categoría (low/high alineados con merchant_categories)
+    amount_lows = np.array([20, 100, 10, 5, 200, 50, 500, 20], dtype=np.float64)
+    amount_highs = np.array([150, 1500, 200, 25, 5000, 3000, 10000, 4000], dtype=np.float64)
+
+    # una sola llamada al RNG por columna, nada de loops por fila
+    customer_idx = rng.integers(0, customer_ids.size, n_rows)
+    customer = customer_ids[customer_idx]
+    country = rng.choice(countries, n_rows)
+    channel = rng.choice(channels, n_rows)
+    mcc_idx = rng.integers(0, merchant_categories.size, n_rows)
+
+    base_amount = amount_lows[mcc_idx] + rng.random(n_rows) * (amount_highs[mcc_idx] - amount_lows[mcc_idx])
+
+    # algunos outliers bien locos
+    outlier_mask = rng.random(n_rows) < 0.05
+    amount = np.round(
+        np.where(
+            outlier_mask,
+            base_amount * rng.uniform(5, 15, n_rows),
+            base_amount * rng.uniform(0.5, 1.5, n_rows),
+        ),
+        2,
+    )
+
+    # saldo previo y nuevo
+    previous_balance = np.round(rng.uniform(0, 20000, n_rows), 2)
+    new_balance = np.maximum(previous_balance - amount, 0)
+
+    # país de IP simulado (a veces distinto al país de la tarjeta)
+    ip_country = rng.choice(countries, n_rows)
+    home_country = home_countries[customer_idx]  # un solo gather, sin lookups por fila
+
+    # resolución de segundos, como declara el formato "%Y-%m-%d %H:%M:%S"
+    tx_time = pd.Timestamp(base_time).floor("s") + pd.to_timedelta(rng.integers(0, 60 * 24 * 7, n_rows), unit="m")
+
+    # layout SoA: un array por columna, el DataFrame se construye por referencia
+    df = pd.DataFrame({
+        "tx_id": np.arange(1, n_rows + 1, dtype=np.int32),
+        "customer_id": customer,
+        "home_country": home_country,
+        "amount": amount,
+        "amount_tier": _amount_tier(amount),
+        "country": country,  # país de la transacción
+        "ip_country": ip_country,
+        "channel": channel,
+        "merchant_category": merchant_categories[mcc_idx],
+        "previous_balance": previous_balance,
+        "new_balance": new_balance,
+        "timestamp": tx_time,
+    })
+
+    # columnas de baja cardinalidad como category: códigos int8 + diccionario
+    country_dtype = pd.CategoricalDtype(countries)
+    for col in ("country", "ip_country", "home_country"):
+        df[col] = df[col].astype(country_dtype)
+    for col in ("channel", "merchant_category"):
+        df[col] = df[col].astype("category")
 
-    rows = []
-    for i in range(n_rows):
-        tx_time = base_time + timedelta(minutes=random.randint(0, 60 * 24 * 7))
-        customer = random.choice(customer_ids)
-        country = random.choice(countries)
-        channel = random.choice(channels)
-        mcc = random.choice(merchant_categories)
-
-        # montos base por categoría
-        base_amount = {
-            "SUPERMERCADO": random.uniform(20, 150),
-            "ELECTRONICA": random.uniform(100, 1500),
-            "RESTAURANTE": random.uniform(10, 200),
-            "SUSCRIPCION_STREAMING": random.uniform(5, 25),
-            "CRIPTO_EXCHANGE": random.uniform(200, 5000),
-            "CASINO_ONLINE": random.uniform(50, 3000),
-            "LUJOS": random.uniform(500, 10000),
-            "TRANSFERENCIA_P2P": random.uniform(20, 4000),
-        }[mcc]
-
-        # algunos outliers bien locos
-        if random.random() < 0.05:
-            amount = round(base_amount * random.uniform(5, 15), 2)
-        else:
-            amount = round(base_amount * random.uniform(0.5, 1.5), 2)
-
-        # saldo previo y nuevo
-        previous_balance = round(random.uniform(0, 20000), 2)
-        new_balance = max(previous_balance - amount, 0)
-
-        # país de IP simulado (a veces distinto al país de la tarjeta)
-        ip_country = random.choice(countries)
-        home_country = home_countries_map[customer]
-
-        row = {
-            "tx_id": i + 1,
-            "customer_id": customer,
-            "home_country": home_country,
-            "amount": amount,
-            "country": country,  # país de la transacción
-            "ip_country": ip_country,
-            "channel": channel,
-            "merchant_category": mcc,
-            "previous_balance": previous_balance,
-            "new_balance": new_balance,
-            "timestamp": tx_time.strftime("%Y-%m-%d %H:%M:%S"),
-        }
-        rows.append(row)
-
-    return rows
-
-
-def save_transactions_to_csv(rows, filename="transactions.csv"):
-    if not rows:
+    return df
+
+
+def save_transactions_to_csv(df: pd.DataFrame, filename="transactions.csv"):
+    if df.empty:
         return
 
-    fieldnames = list(rows[0].keys())
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    # writer multihilo de pyarrow, sin formatear celdas en Python
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if "timestamp" in table.column_names:
+        # en segundos, para que el CSV salga como "%Y-%m-%d %H:%M:%S"
+        i = table.schema.get_field_index("timestamp")
+        table = table.set_column(i, "timestamp", table.column("timestamp").cast(pa.timestamp("s")))
+    pa_csv.write_csv(table, filename)
+
+
+def load_transactions_from_csv(filename="transactions.csv") -> pd.DataFrame:
+    """Lee un CSV de transacciones con el parser multihilo de pyarrow.
+
+    Las columnas de baja cardinalidad entran directo como dictionary-encoded
+    (equivalente a Categorical en pandas), sin pasar por columnas object.
+    """
+    convert_options = pa_csv.ConvertOptions(
+        column_types={
+            col: pa.dictionary(pa.int32(), pa.string())
+            for col in ("country", "ip_country", "home_country", "channel", "merchant_category")
+        },
+        timestamp_parsers=["%Y-%m-%d %H:%M:%S"],
+    )
+    df = pa_csv.read_csv(filename, convert_options=convert_options).to_pandas()
+    if "amount_tier" not in df.columns:
+        df["amount_tier"] = _amount_tier(df["amount"].to_numpy())
+    else:
+        df["amount_tier"] = df["amount_tier"].astype(np.int8)
+    return df
 
 
 # -----------------------------
 # 2. Reglas avanzadas de fraude
 # -----------------------------
 
+# umbrales de las reglas, izados a nivel de módulo para no reconstruirlos por llamada
+HIGH_AMOUNT_THRESHOLD = 8000
+RISKY_COUNTRIES = ("NG", "RU", "CN")
+NIGHT_AMOUNT_THRESHOLD = 500
+WINDOW_MINUTES = 10
+MAX_TX_IN_WINDOW = 6
+DRAIN_BALANCE_RATIO = 0.05
+DRAIN_AMOUNT_THRESHOLD = 1000
+
+# cortes para amount_tier: 0 <500, 1 500-1000, 2 1000-8000, 3 >8000
+# (side="left" en el binning preserva la desigualdad estricta de cada regla)
+AMOUNT_TIER_BOUNDS = np.array(
+    [NIGHT_AMOUNT_THRESHOLD, DRAIN_AMOUNT_THRESHOLD, HIGH_AMOUNT_THRESHOLD], dtype=np.float64
+)
+
+
+def _amount_tier(amount) -> np.ndarray:
+    return np.searchsorted(AMOUNT_TIER_BOUNDS, amount, side="left").astype(np.int8)
+
+# una razón por regla; el bit i de reason_mask indica que la regla i disparó
+REASONS = (
+    "Monto extremadamente alto",
+    "País de alto riesgo",
+    "IP y tarjeta en países distintos",
+    "Actividad nocturna inusual",
+    f"Alta frecuencia en {WINDOW_MINUTES}min",
+    "Vaciado de cuenta",
+)
+
+# las 2^6 combinaciones posibles, pre-materializadas una sola vez
+_REASON_LUT = np.array([
+    "".join(REASONS[i] + "; " for i in range(len(REASONS)) if mask & (1 << i))
+    for mask in range(1 << len(REASONS))
+])
+
+
+def decode_reasons(reason_mask) -> np.ndarray:
+    """Materializa el texto de 'reason' desde el bitmask (solo al mostrar/exportar)."""
+    return _REASON_LUT[np.asarray(reason_mask, dtype=np.uint8)]
+
+
+def _flag_frequency(cid, t_ns, window_ns, max_tx):
+    # dos punteros sobre arrays ordenados por (cliente, tiempo)
+    n = cid.shape[0]
+    out = np.zeros(n, dtype=np.bool_)
+    start = 0
+    for end in range(n):
+        if end > 0 and cid[end] != cid[end - 1]:
+            start = end
+        while t_ns[end] - t_ns[start] > window_ns:
+            start += 1
+        if end - start + 1 >= max_tx:
+            out[start:end + 1] = True
+    return out
+
+
+if njit is not None:
+    _flag_frequency = njit(cache=True)(_flag_frequency)
+
+
 def apply_fraud_rules(df: pd.DataFrame) -> pd.DataFrame:
     """
     Aplica reglas de fraude y calcula un score de riesgo.
     """
 
-    df = df.copy()
-    df["is_suspicious"] = False
-    df["reason"] = ""
-    df["risk_score"] = 0  # 0 a 100
-
-    # Convertimos timestamp a datetime
-    df["timestamp_dt"] = pd.to_datetime(df["timestamp"])
+    # Aseguramos dtypes category con categorías unificadas entre columnas de país,
+    # así las comparaciones de las reglas 2 y 3 trabajan sobre códigos enteros
+    country_cols = ("country", "ip_country", "home_country")
+    shared_countries = pd.api.types.union_categoricals(
+        [pd.Categorical(df[col]) for col in country_cols]
+    ).categories
+
+    dtype_map = {
+        col: "category"
+        for col in ("channel", "merchant_category")
+        if not isinstance(df[col].dtype, pd.CategoricalDtype)
+    }
+
+    # astype ya devuelve un frame nuevo (copy-on-write, sin memcpy completo),
+    # así que no hace falta un df.copy() y el caller no ve columnas auxiliares
+    df = df.astype(dtype_map)
+
+    # reconstruimos por valor con el MISMO orden de categorías en las tres
+    # columnas (astype no recodifica cuando el set de categorías coincide)
+    for col in country_cols:
+        df[col] = pd.Categorical(df[col], categories=shared_countries)
+
+    # Convertimos timestamp a datetime (no hace falta si ya viene de Parquet/Feather);
+    # el formato fijo evita el sniffing por elemento de pandas
+    if pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
+        df["timestamp_dt"] = df["timestamp"]
+    else:
+        df["timestamp_dt"] = pd.to_datetime(df["timestamp"], format="%Y-%m-%d %H:%M:%S", cache=True)
     df["hour"] = df["timestamp_dt"].dt.hour
 
+    # Ordenamos una sola vez: la regla 5 necesita (cliente, tiempo) contiguos
+    df = df.sort_values(by=["customer_id", "timestamp_dt"])
+
+    # Los umbrales de monto se comparan sobre el tier int8 pre-binneado
+    # (tres comparaciones de 1 byte en vez de tres pasadas sobre float64)
+    if "amount_tier" in df.columns:
+        amount_tier = df["amount_tier"].to_numpy()
+    else:
+        amount_tier = _amount_tier(df["amount"].to_numpy())
+
     # Regla 1: monto muy alto
-    high_amount_mask = df["amount"] > 8000
-    df.loc[high_amount_mask, "is_suspicious"] = True
-    df.loc[high_amount_mask, "reason"] += "Monto extremadamente alto; "
-    df.loc[high_amount_mask, "risk_score"] += 40
-
-    # Regla 2: país de riesgo
-    risky_countries = ["NG", "RU", "CN"]
-    risky_country_mask = df["country"].isin(risky_countries)
-    df.loc[risky_country_mask, "is_suspicious"] = True
-    df.loc[risky_country_mask, "reason"] += "País de alto riesgo; "
-    df.loc[risky_country_mask, "risk_score"] += 25
+    high_amount_mask = amount_tier == 3
+
+    # Regla 2: país de riesgo (comparación sobre códigos de la categórica)
+    risky_codes = df["country"].cat.categories.get_indexer(list(RISKY_COUNTRIES))
+    risky_codes = risky_codes[risky_codes >= 0]
+    risky_country_mask = np.isin(df["country"].cat.codes.to_numpy(), risky_codes)
 
     # Regla 3: IP en país distinto al país de tarjeta + transacción internacional
-    mismatch_country_mask = (df["ip_country"] != df["home_country"]) & (df["country"] != df["home_country"])
-    df.loc[mismatch_country_mask, "is_suspicious"] = True
-    df.loc[mismatch_country_mask, "reason"] += "IP y tarjeta en países distintos; "
-    df.loc[mismatch_country_mask, "risk_score"] += 20
+    # (las tres columnas comparten categorías, así que los códigos son comparables)
+    home_codes = df["home_country"].cat.codes.to_numpy()
+    mismatch_country_mask = (df["ip_country"].cat.codes.to_numpy() != home_codes) & (
+        df["country"].cat.codes.to_numpy() != home_codes
+    )
 
     # Regla 4: transacciones nocturnas (0 a 5 AM) con monto medio/alto
-    night_mask = df["hour"].between(0, 5) & (df["amount"] > 500)
-    df.loc[night_mask, "is_suspicious"] = True
-    df.loc[night_mask, "reason"] += "Actividad nocturna inusual; "
-    df.loc[night_mask, "risk_score"] += 15
+    night_mask = (df["hour"].to_numpy() <= 5) & (amount_tier >= 1)
 
     # Regla 5: muchos intentos en ventana corta por cliente
-    df = df.sort_values(by=["customer_id", "timestamp_dt"])
+    n = len(df)
+    t = df["timestamp_dt"].to_numpy().astype("datetime64[ns]").astype(np.int64)
+    cid = df["customer_id"].to_numpy()
+    window_ns = WINDOW_MINUTES * 60 * 10**9
+
+    if njit is not None:
+        # kernel compilado: dos punteros en una sola pasada
+        burst_mask = _flag_frequency(cid, t, window_ns, MAX_TX_IN_WINDOW)
+    else:
+        # tras el sort los grupos por cliente son contiguos: los límites salen
+        # de los cambios de cid, sin iterar groupby ni construir sub-frames
+        is_new_group = np.r_[True, cid[1:] != cid[:-1]]
+        starts = np.flatnonzero(is_new_group)
+        ends = np.r_[starts[1:], n]
+
+        # searchsorted por grupo sobre su slice [lo, hi): una clave combinada
+        # group_id * span desborda int64 silenciosamente con decenas de miles
+        # de clientes, así que el inicio de ventana se busca dentro de cada grupo
+        left = np.arange(n)
+        for lo, hi in zip(starts, ends):
+            if hi - lo < MAX_TX_IN_WINDOW:
+                continue  # grupo demasiado chico para disparar la regla
+            left[lo:hi] = lo + np.searchsorted(t[lo:hi], t[lo:hi] - window_ns, side="left")
+
+        window_size = np.arange(n) - left + 1
+
+        # cada ventana que llega al umbral cubre [left[k], k]; lo propagamos con un diff+cumsum
+        hits = np.flatnonzero(window_size >= MAX_TX_IN_WINDOW)
+        delta = np.zeros(n + 1, dtype=np.int64)
+        np.add.at(delta, left[hits], 1)
+        np.add.at(delta, hits + 1, -1)
+        burst_mask = np.cumsum(delta[:-1]) > 0
 
-    window_minutes = 10
-    max_tx_in_window = 6
-    suspicious_idx = []
+    # Regla 6: saldo casi en cero luego de un debito fuerte
+    # (la parte de saldos sigue fusionada vía numexpr; el monto es un compare de tier)
+    almost_zero_mask = df.eval(
+        "previous_balance > 0 and new_balance < previous_balance * @DRAIN_BALANCE_RATIO"
+    ).to_numpy() & (amount_tier >= 2)
+
+    # Score, is_suspicious y reason_mask fusionados: una sola pasada sobre las
+    # seis máscaras en vez de escrituras enmascaradas sobre columnas completas
+    m1 = high_amount_mask.astype(np.uint8)
+    m2 = risky_country_mask.astype(np.uint8)
+    m3 = mismatch_country_mask.astype(np.uint8)
+    m4 = night_mask.astype(np.uint8)
+    m5 = burst_mask.astype(np.uint8)
+    m6 = almost_zero_mask.astype(np.uint8)
+
+    score = 40 * m1 + 25 * m2 + 20 * m3 + 15 * m4 + 30 * m5 + 20 * m6
+    df["risk_score"] = np.minimum(score, 100).astype(np.int8)  # 0 a 100
+    df["is_suspicious"] = (m1 | m2 | m3 | m4 | m5 | m6).astype(bool)
+
+    # un bit por regla; el texto se materializa recién con decode_reasons
+    df["reason_mask"] = m1 | (m2 << 1) | (m3 << 2) | (m4 << 3) | (m5 << 4) | (m6 << 5)
+
+    # Etiqueta de riesgo: binning vectorizado sobre los umbrales 1/40/70
+    # (0 -> NONE, 1-39 -> LOW, 40-69 -> MEDIUM, 70+ -> HIGH)
+    risk_labels = np.array(["NONE", "LOW", "MEDIUM", "HIGH"])
+    label_codes = np.searchsorted([1, 40, 70], df["risk_score"].to_numpy(), side="right")
+    df["risk_label"] = pd.Categorical.from_codes(label_codes, risk_labels)
+
+    # columnas auxiliares fuera: ambas son redundantes con timestamp
+    df = df.drop(columns=["timestamp_dt", "hour"])
 
-    for customer_id, group in df.groupby("customer_id"):
-        times = group["timestamp_dt"].tolist()
-        indices = group.index.tolist()
+    return df
 
-        start = 0
-        for end in range(len(times)):
-            while (times[end] - times[start]).total_seconds() / 60 > window_minutes:
-                start += 1
 
-            window_size = end - start + 1
-            if window_size >= max_tx_in_window:
-                suspicious_idx.extend(indices[start:end + 1])
+def apply_fraud_rules_parallel(df: pd.DataFrame, npartitions=None, min_rows: int = 100_000) -> pd.DataFrame:
+    """
+    Versión paralela de apply_fraud_rules para entradas grandes.
 
-    df.loc[suspicious_idx, "is_suspicious"] = True
-    df.loc[suspicious_idx, "reason"] += f"Alta frecuencia en {window_minutes}min; "
-    df.loc[suspicious_idx, "risk_score"] += 30
+    Particiona por customer_id (las reglas son locales por fila, salvo la 5
+    que es local por cliente) y corre la versión serial en cada partición.
+    Sin dask instalado, o por debajo de min_rows, delega en la versión serial.
+    """
+    if dd is None or len(df) < min_rows:
+        return apply_fraud_rules(df)
 
-    # Regla 6: saldo casi en cero luego de un debito fuerte
-    almost_zero_mask = (df["previous_balance"] > 0) & (df["new_balance"] < df["previous_balance"] * 0.05) & (df["amount"] > 1000)
-    df.loc[almost_zero_mask, "is_suspicious"] = True
-    df.loc[almost_zero_mask, "reason"] += "Vaciado de cuenta; "
-    df.loc[almost_zero_mask, "risk_score"] += 20
-
-    # Normalizar risk_score máximo 100
-    df["risk_score"] = df["risk_score"].clip(0, 100)
-
-    # Etiqueta de riesgo
-    def label_risk(score):
-        if score >= 70:
-            return "HIGH"
-        elif score >= 40:
-            return "MEDIUM"
-        elif score > 0:
-            return "LOW"
-        else:
-            return "NONE"
-
-    df["risk_label"] = df["risk_score"].apply(label_risk)
+    npartitions = npartitions or os.cpu_count() or 1
+    indexed = df.sort_values("customer_id").set_index("customer_id")
+    ddf = dd.from_pandas(indexed, npartitions=npartitions)
+    # las divisiones caen en límites de customer_id: ningún cliente queda partido
+    result = ddf.map_partitions(lambda part: apply_fraud_rules(part.reset_index())).compute()
 
-    return df
+    # reset_index antepone customer_id: restauramos el orden de columnas de la
+    # versión serial (las originales más las agregadas por las reglas al final)
+    serial_cols = [c for c in df.columns if c in result.columns]
+    serial_cols += [c for c in result.columns if c not in df.columns]
+    return result[serial_cols]
 
 
 # -----------------------------
@@ -191,7 +363,7 @@ def apply_fraud_rules(df: pd.DataFrame) -> pd.DataFrame:
 
 def print_summary(df_result: pd.DataFrame):
     total = len(df_result)
-    suspicious = df_result[df_result["is_suspicious"] == True]
+    suspicious = df_result[df_result["is_suspicious"]]
     n_susp = len(suspicious)
 
     print("========== RESUMEN DE FRAUDE ==========")
@@ -216,34 +388,47 @@ def print_summary(df_result: pd.DataFrame):
         "risk_label",
         "reason",
     ]
-    print(suspicious.sort_values(by="risk_score", ascending=False)[cols].head(10).to_string(index=False))
+    # nlargest hace un top-k parcial (argpartition), sin ordenar todo el frame
+    top = suspicious.nlargest(10, "risk_score")
+    top = top.assign(reason=decode_reasons(top["reason_mask"]))
+    print(top[cols].to_string(index=False))
 
 
 # -----------------------------
 # 4. Main
 # -----------------------------
 
-def main():
+def main(export_csv: bool = False):
     print("Generando transacciones sintéticas avanzadas...")
-    rows = generate_synthetic_transactions(n_rows=1500)
-    save_transactions_to_csv(rows, "transactions.csv")
-    print("Archivo 'transactions.csv' generado.")
-
-    print("Cargando datos y aplicando reglas de fraude avanzadas...")
-    df = pd.read_csv("transactions.csv")
+    df = generate_synthetic_transactions(n_rows=1500)
+    df.to_parquet("transactions.parquet", compression="snappy")
+    print("Archivo 'transactions.parquet' generado.")
 
-    df_result = apply_fraud_rules(df)
+    print("Aplicando reglas de fraude avanzadas...")
+    df_result = apply_fraud_rules_parallel(df)
 
     # Guardar dataset completo con score
-    df_result.to_csv("transactions_scored.csv", index=False)
-
-    # Guardar solo sospechosas
-    suspicious = df_result[df_result["is_suspicious"] == True]
-    suspicious.to_csv("suspicious_transactions.csv", index=False)
+    df_result.to_parquet("transactions_scored.parquet", compression="snappy")
+
+    # Guardar solo sospechosas (Feather: round-trip más rápido). El filtro corre
+    # sobre los buffers columnares de Arrow, sin materializar un segundo
+    # DataFrame completo; el texto de reason se decodifica solo para este subconjunto
+    table = pa.Table.from_pandas(df_result, preserve_index=False)
+    suspicious_tbl = table.filter(pa.array(df_result["is_suspicious"].to_numpy()))
+    suspicious_tbl = suspicious_tbl.append_column(
+        "reason", pa.array(decode_reasons(suspicious_tbl.column("reason_mask").to_numpy()))
+    )
+    pa_feather.write_feather(suspicious_tbl, "suspicious_transactions.feather")
+
+    # CSV solo como export opcional
+    if export_csv:
+        save_transactions_to_csv(df, "transactions.csv")
+        pa_csv.write_csv(table, "transactions_scored.csv")
+        pa_csv.write_csv(suspicious_tbl, "suspicious_transactions.csv")
 
     print("Archivos generados:")
-    print("- transactions_scored.csv (todas las transacciones con score)")
-    print("- suspicious_transactions.csv (solo las sospechosas)")
+    print("- transactions_scored.parquet (todas las transacciones con score)")
+    print("- suspicious_transactions.feather (solo las sospechosas)")
     print()
 
     print_summary(df_result)